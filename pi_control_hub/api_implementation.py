@@ -14,7 +14,6 @@
    limitations under the License.
 """
 
-import base64
 from typing import List
 
 from fastapi import HTTPException
@@ -42,33 +41,38 @@ from pi_control_hub.driver_manager import (DeviceNotFoundException,
 class PiControlHubApi(BaseDefaultApi, metaclass=SingletonMeta):
     """Implementation of the PiControl Hub REST API."""
 
+    def __init__(self):
+        super().__init__()
+        self._driver_manager = DriverManager()
+        self._device_drivers: List[DeviceDriver] = None
+
     async def read_device_drivers(self) -> List[DeviceDriver]:
         """Read all installed device drivers"""
-        driver_descriptors = await DriverManager().read_drivers()
-        drivers = map(
-            lambda descriptor: DeviceDriver(
+        if self._device_drivers is not None:
+            return self._device_drivers
+
+        driver_descriptors = await self._driver_manager.read_drivers()
+        self._device_drivers = [
+            DeviceDriver(
                 driverId=str(descriptor.driver_id),
                 displayName=descriptor.display_name,
                 description=descriptor.description,
                 authenticationMethod=descriptor.authentication_method.name,
-            ),
-            driver_descriptors,
-        )
-        return list(drivers)
+            )
+            for descriptor in driver_descriptors
+        ]
+        return self._device_drivers
 
     async def read_devices(self, driverId: str) -> List[DeviceInfo]:
         """Read all devices that are supported by the driver with the given driver ID"""
         try:
-            result = list(
-                    map(
-                    lambda dinfo: DeviceInfo(
-                        deviceId=dinfo.device_id,
-                        name=dinfo.name,
-                    ),
-                    await DriverManager().read_devices(driverId),
+            return [
+                DeviceInfo(
+                    deviceId=dinfo.device_id,
+                    name=dinfo.name,
                 )
-            )
-            return result
+                for dinfo in await self._driver_manager.read_devices(driverId)
+            ]
         except DriverNotFoundException as ex:
             raise HTTPException(status_code=404, detail=str(ex)) from ex
 
@@ -80,7 +84,7 @@ class PiControlHubApi(BaseDefaultApi, metaclass=SingletonMeta):
     ) -> StartPairingResponse:
         """Start the pairing process for the device with the given device ID."""
         try:
-            pairing_request, device_provides_pin = await DriverManager().start_pairing(
+            pairing_request, device_provides_pin = await self._driver_manager.start_pairing(
                 driver_id=driverId,
                 device_id=deviceId,
                 remote_name=start_pairing_request.remote_name)
@@ -101,7 +105,7 @@ class PiControlHubApi(BaseDefaultApi, metaclass=SingletonMeta):
     ) -> FinalizePairingResponse:
         """Finalize the pairing process for the device with the given device ID."""
         try:
-            paired = await DriverManager().finalize_pairing(
+            paired = await self._driver_manager.finalize_pairing(
                 driver_id=driverId,
                 device_id=deviceId,
                 pairing_request_id=pairingRequestId,
@@ -117,39 +121,38 @@ class PiControlHubApi(BaseDefaultApi, metaclass=SingletonMeta):
 
     async def read_paired_devices(self) -> List[PairedDevice]:
         """Read the list of paired devices."""
-        return list(
-            map(
-                lambda d: PairedDevice(
-                    pairingId=d.pairing_id,
-                    driverId=d.driver_id,
-                    deviceId=d.device_id,
-                    deviceName=d.device_name
-                ),
-                DriverManager().paired_devices))
+        return [
+            PairedDevice(
+                pairingId=d.pairing_id,
+                driverId=d.driver_id,
+                deviceId=d.device_id,
+                deviceName=d.device_name
+            )
+            for d in self._driver_manager.paired_devices
+        ]
 
     async def unpair_device(self,pairingId: str) -> None:
         """Unpair the device."""
         try:
-            DriverManager().unpair_device(pairingId)
+            await self._driver_manager.unpair_device(pairingId)
         except DeviceNotFoundException as ex:
             raise HTTPException(status_code=404, detail=str(ex)) from ex
 
     async def read_device_commands(self, pairingId: str) -> List[DeviceCommand]:
         """Get the commands supported by the device."""
         try:
-            driver_manager = DriverManager()
-            paired_device = driver_manager.get_paired_device(pairingId)
-            commands = list(
-                map(
-                    lambda c: DeviceCommand(
-                        pairing_id=pairingId,
-                        driver_id=paired_device.driver_id,
-                        device_id=paired_device.device_id,
-                        command_id=c.id,
-                        name=c.title,
-                        icon=base64.b64encode(c.icon).decode('ascii'),
-                    ),
-                    await driver_manager.read_device_commands(pairingId)))
+            paired_device = self._driver_manager.get_paired_device(pairingId)
+            commands = [
+                DeviceCommand(
+                    pairing_id=pairingId,
+                    driver_id=paired_device.driver_id,
+                    device_id=paired_device.device_id,
+                    command_id=command.id,
+                    name=command.title,
+                    icon=icon,
+                )
+                for command, icon in await self._driver_manager.read_device_commands(pairingId)
+            ]
             return commands
         except DeviceNotFoundException as ex:
             raise HTTPException(status_code=404, detail=str(ex)) from ex
@@ -157,8 +160,7 @@ class PiControlHubApi(BaseDefaultApi, metaclass=SingletonMeta):
     async def read_device_remote_layout(self,pairingId: str) -> RemoteLayout:
         """Get the layout of the remote control for the device."""
         try:
-            driver_manager = DriverManager()
-            width, height, buttons = await driver_manager.get_remote_layout(pairingId)
+            width, height, buttons = await self._driver_manager.get_remote_layout(pairingId)
             return RemoteLayout(width=width, height=height, buttons=buttons)
         except DeviceNotFoundException as ex:
             raise HTTPException(status_code=404, detail=str(ex)) from ex
@@ -166,7 +168,7 @@ class PiControlHubApi(BaseDefaultApi, metaclass=SingletonMeta):
     async def execute_device_command(self, pairingId: str, commandId: int) -> int:
         """Execute the command on the paired device."""
         try:
-            await DriverManager().execute_device_command(pairingId, commandId)
+            await self._driver_manager.execute_device_command(pairingId, commandId)
             raise HTTPException(status_code=204, detail="All is good")
         except DeviceNotFoundException as ex:
             raise HTTPException(status_code=404, detail=str(ex)) from ex
@@ -174,4 +176,4 @@ class PiControlHubApi(BaseDefaultApi, metaclass=SingletonMeta):
 
     async def is_device_ready(self, pairingId: str) -> bool:
         """Check whether the device is ready for executing commands."""
-        return await DriverManager().is_device_ready(pairingId)
+        return await self._driver_manager.is_device_ready(pairingId)
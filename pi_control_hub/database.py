@@ -14,9 +14,12 @@
    limitations under the License.
 """
 
+import asyncio
 import json
 import shelve
-from typing import Any, List, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import List, TypeVar
 
 from pi_control_hub.design_patterns import SingletonMeta
 
@@ -37,40 +40,88 @@ class Shelve(metaclass=SingletonMeta):
         Shelve.__database_path = db_path
 
     def __init__(self):
-        self._db = shelve.open(Shelve.__database_path)
+        # dbm backends like dbm.sqlite3 may only be used from the thread that
+        # opened them, hence every access goes through this single thread
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="shelve")
+        self._db = self._call(shelve.open, Shelve.__database_path, flag="c")
 
     def __del__(self):
-        self._db.close()
+        try:
+            self.close()
+        except RuntimeError:
+            # the executor has already been shut down
+            pass
 
-    def open_shelf(self) -> shelve.Shelf[Any]:
-        """Open the shelf"""
-        return shelve.open(Shelve.__database_path, flag="c")
+    @staticmethod
+    def close_instance():
+        """Close the shelf, if it was opened, and drop the Singleton instance
+        so that a later Shelve() call opens the shelf again."""
+        if Shelve.has_instance():
+            Shelve().close()
+            Shelve.drop_instance()
+
+    def _call(self, func, *args, **kwargs):
+        """Runs the function on the shelf thread and returns its result."""
+        return self._executor.submit(func, *args, **kwargs).result()
+
+    async def _async_call(self, func, *args, **kwargs):
+        """Runs the function on the shelf thread without blocking the event loop."""
+        return await asyncio.wrap_future(self._executor.submit(func, *args, **kwargs))
+
+    def close(self):
+        """Flush and close the shelf."""
+        self._call(self._db.close)
+        self._executor.shutdown()
 
     def load(self, key: dict) -> ENTITY:
         """Load the object for the given key. Raises a KeyError if there
         is no such key."""
-        key_str = json.dumps(key)
-        with self.open_shelf() as db:
-            return db[key_str]
+        return self._call(self._db.__getitem__, json.dumps(key))
 
     def save(self, key: dict, entity: ENTITY):
         """Save the given entity under the key."""
-        key_str = json.dumps(key)
-        with self.open_shelf() as db:
-            db[key_str] = entity
-            db.sync()
+        self._call(self._save, json.dumps(key), entity)
+
+    async def async_save(self, key: dict, entity: ENTITY):
+        """Save the given entity under the key without blocking the event loop."""
+        await self._async_call(self._save, json.dumps(key), entity)
+
+    def _save(self, key_str: str, entity: ENTITY):
+        """Runs on the shelf thread."""
+        self._db[key_str] = entity
+        self._db.sync()
 
     def delete(self, key: dict):
         """Delete the entity with the given key. Raises KeyError
         if there is no such key."""
-        key_str = json.dumps(key)
-        with self.open_shelf() as db:
-            del db[key_str]
+        self._call(self._delete, json.dumps(key))
+
+    async def async_delete(self, key: dict):
+        """Delete the entity with the given key without blocking the event
+        loop. Raises KeyError if there is no such key."""
+        await self._async_call(self._delete, json.dumps(key))
+
+    def _delete(self, key_str: str):
+        """Runs on the shelf thread."""
+        del self._db[key_str]
+        self._db.sync()
 
     def keys(self) -> List[str]:
         """Returns a list with all keys. Might be slow."""
-        with self.open_shelf() as db:
-            return list(db.keys())
+        return self._call(lambda: list(self._db.keys()))
+
+    def load_by_class(self, class_name: str) -> List[ENTITY]:
+        """Load all entities whose key has the given class, in a single pass
+        over the shelf."""
+        return self._call(self._load_by_class, class_name)
+
+    def _load_by_class(self, class_name: str) -> List[ENTITY]:
+        """Runs on the shelf thread."""
+        return [
+            self._db[key_str]
+            for key_str in self._db.keys()
+            if json.loads(key_str).get("class") == class_name
+        ]
 
 
 class PairedDevice:
@@ -81,7 +132,7 @@ class PairedDevice:
         self._device_id = device_id
         self._device_name = device_name
 
-    @property
+    @cached_property
     def pairing_id(self) -> str:
         """Returns the pairing ID for this paired device object.
         Throws an InvalidKeyException, if one key component is None."""
@@ -104,7 +155,7 @@ class PairedDevice:
         """Returns the device name."""
         return self._device_name
 
-    @property
+    @cached_property
     def key(self) -> dict:
         """Returns the key for this paired device object.
         Throws an InvalidKeyException, if one key component is None."""
@@ -121,13 +172,4 @@ class PairedDevice:
     @staticmethod
     def load_all(db: Shelve) -> List:
         """Returns a list with all paired devices."""
-        return list(
-            map(
-                lambda k: db.load(k),
-                list(
-                    filter(
-                        lambda k: k["class"] == PairedDevice.__name__,
-                        list(
-                            map(
-                                lambda k: json.loads(k),
-                                db.keys()))))))
+        return db.load_by_class(PairedDevice.__name__)
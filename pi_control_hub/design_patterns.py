@@ -49,4 +49,18 @@ class SingletonMeta(type):
             if cls not in cls._instances:
                 instance = super().__call__(*args, **kwargs)
                 cls._instances[cls] = instance
-        return cls._instances[cls]
\ No newline at end of file
+        return cls._instances[cls]
+
+    def has_instance(cls) -> bool:
+        """
+        Returns whether the Singleton instance has been created.
+        """
+        with cls._lock:
+            return cls in cls._instances
+
+    def drop_instance(cls):
+        """
+        Forgets the Singleton instance, the next call creates a new one.
+        """
+        with cls._lock:
+            cls._instances.pop(cls, None)
@@ -14,8 +14,9 @@
    limitations under the License.
 """
 
+import base64
 from threading import Thread
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 import pi_control_hub_driver_api
 from cachetools import TTLCache
@@ -65,44 +66,86 @@ class DriverManager(metaclass=SingletonMeta):
     """
 
     def __init__(self):
-        self._cache = TTLCache(maxsize=10, ttl=300)
+        self._devices_cache = TTLCache(maxsize=64, ttl=300)
+        self._instance_cache = TTLCache(maxsize=256, ttl=3600)
+        self._commands_cache = TTLCache(maxsize=256, ttl=300)
+        self._drivers: List[DeviceDriverDescriptor] = None
+        self._drivers_by_id: Dict[str, DeviceDriverDescriptor] = {}
+        self._paired_devices: Dict[str, PairedDevice] = None
+        self._layout_cache: Dict[str, Tuple[int, int, List[List[int]]]] = {}
+
+    def _load_drivers(self):
+        """Scan the installed drivers once and index them by their driver ID."""
+        if self._drivers is None:
+            self._drivers = installed_drivers()
+            self._drivers_by_id = {
+                str(descriptor.driver_id): descriptor for descriptor in self._drivers
+            }
+
+    def preload(self):
+        """Scan the installed drivers and load the paired devices up front,
+        so that the first request doesn't pay for it."""
+        self._load_drivers()
+        self._load_paired_devices()
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether the installed drivers have been scanned, the paired devices
+        have been loaded and the shelve is open."""
+        return self._drivers is not None and self._paired_devices is not None and Shelve.has_instance()
+
+    def _load_paired_devices(self) -> Dict[str, PairedDevice]:
+        """Load the paired devices from the shelve once and keep them in memory.
+        The shelve stays the source of truth, all changes are written through."""
+        if self._paired_devices is None:
+            self._paired_devices = {
+                paired_device.pairing_id: paired_device
+                for paired_device in PairedDevice.load_all(Shelve())
+            }
+        return self._paired_devices
 
     async def read_drivers(self) -> List[DeviceDriverDescriptor]:
         """This method returns DeviceDriverDescriptor instances of the
         installed drivers."""
-        return installed_drivers()
+        self._load_drivers()
+        return self._drivers
 
     async def retrieve_driver(self, driver_id: str) -> DeviceDriverDescriptor:
         """Return the driver descriptor with the given ID."""
-        result = list(
-            filter(
-                lambda descriptor: str(descriptor.driver_id) == driver_id,
-                await self.read_drivers(),
-            )
-        )
-        if len(result) > 0:
-            return result[0]
-        raise DriverNotFoundException(driver_id)
+        self._load_drivers()
+        try:
+            return self._drivers_by_id[driver_id]
+        except KeyError as ex:
+            raise DriverNotFoundException(driver_id) from ex
 
-    async def read_devices(self, driver_id: str) -> List[DeviceInfo]:
-        """Read the devices from a driver."""
+    async def _read_devices_entry(self, driver_id: str) -> Tuple[List[DeviceInfo], Dict[str, DeviceInfo]]:
+        """Read the devices from a driver together with an index by device ID.
+        Both are cached in the same entry, so that they expire together."""
         cache_key = f"devices({driver_id})"
 
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        if cache_key in self._devices_cache:
+            return self._devices_cache[cache_key]
 
         driver_descriptor = await self.retrieve_driver(driver_id)
         devices = await driver_descriptor.get_devices()
-        self._cache[cache_key] = devices
+        # reversed, so that the first device wins if a driver reports an ID twice
+        devices_by_id = {d.device_id: d for d in reversed(devices)}
+        self._devices_cache[cache_key] = devices, devices_by_id
+        return devices, devices_by_id
+
+    async def read_devices(self, driver_id: str) -> List[DeviceInfo]:
+        """Read the devices from a driver."""
+        devices, _ = await self._read_devices_entry(driver_id)
         return devices
 
     async def retrieve_driver_and_device(self, driver_id: str, device_id: str) -> Tuple[DeviceDriverDescriptor, DeviceInfo]:
         """Retrieve the device info for the device identified by a driver ID and device ID."""
         driver = await self.retrieve_driver(driver_id)
-        devices = list(filter(lambda d: d.device_id == device_id, await self.read_devices(driver_id)))
-        if not devices or len(devices) == 0:
-            raise DeviceNotFoundException(driver_id=driver_id, device_id=device_id)
-        return driver, devices[0]
+        _, devices_by_id = await self._read_devices_entry(driver_id)
+        try:
+            return driver, devices_by_id[device_id]
+        except KeyError as ex:
+            raise DeviceNotFoundException(driver_id=driver_id, device_id=device_id) from ex
 
     async def start_pairing(self, driver_id: str, device_id: str, remote_name: str) -> Tuple[str, bool]:
         """Start the pairing process of the given device with the device driver descriptor."""
@@ -130,7 +173,9 @@ class DriverManager(metaclass=SingletonMeta):
                     driver_id=driver_id,
                     device_id=device_id,
                     device_name=device.name)
-                Shelve().save(paired_device.key, paired_device)
+                await Shelve().async_save(paired_device.key, paired_device)
+                self._load_paired_devices()[paired_device.pairing_id] = paired_device
+                self._forget_pairing(paired_device.pairing_id)
             return paired
         except (DeviceDriverException, InvalidKeyException) as ex:
             raise PairingException(driver_id, device_id, pairing_request_id) from ex
@@ -138,51 +183,81 @@ class DriverManager(metaclass=SingletonMeta):
     @property
     def paired_devices(self) -> List[PairedDevice]:
         """All paired devices"""
-        return PairedDevice.load_all(Shelve())
+        return list(self._load_paired_devices().values())
 
     def get_paired_device(self, pairing_id: str) -> PairedDevice:
         """Load the paired device with the given pairing ID."""
         try:
-            return Shelve().load(PairedDevice.key_from_pairing_id(pairing_id))
+            return self._load_paired_devices()[pairing_id]
         except KeyError as ex:
-            raise DeviceNotFoundException(f"The device with the pairing ID '{pairing_id}' wasn't found.") from ex
+            raise DeviceNotFoundException(message=f"The device with the pairing ID '{pairing_id}' wasn't found.") from ex
 
-    def unpair_device(self, pairing_id: str):
+    async def unpair_device(self, pairing_id: str):
         """Deletes a device pairing"""
         try:
-            Shelve().delete(PairedDevice.key_from_pairing_id(pairing_id))
+            await Shelve().async_delete(PairedDevice.key_from_pairing_id(pairing_id))
+            self._load_paired_devices().pop(pairing_id, None)
+            self._forget_pairing(pairing_id)
         except (KeyError, pi_control_hub_driver_api.DeviceNotFoundException) as ex:
-            raise DeviceNotFoundException(f"The device with the pairing ID '{pairing_id}' wasn't found.") from ex
+            raise DeviceNotFoundException(message=f"The device with the pairing ID '{pairing_id}' wasn't found.") from ex
+
+    def _is_paired(self, pairing_id: str) -> bool:
+        """Whether a pairing with the given ID exists."""
+        return pairing_id in self._load_paired_devices()
+
+    def _forget_pairing(self, pairing_id: str):
+        """Drop everything that is cached for the given pairing ID."""
+        self._instance_cache.pop(pairing_id, None)
+        self._commands_cache.pop(pairing_id, None)
+        self._layout_cache.pop(pairing_id, None)
 
     async def device_instance_for_pairing_id(self, pairing_id: str) -> DeviceDriver:
-        if pairing_id in self._cache:
-            return self._cache[pairing_id]
+        if pairing_id in self._instance_cache and self._is_paired(pairing_id):
+            return self._instance_cache[pairing_id]
         paired_device = self.get_paired_device(pairing_id)
         driver, device = await self.retrieve_driver_and_device(
             paired_device.driver_id,
             paired_device.device_id)
         device_instance = await driver.create_device_instance(device.device_id)
-        self._cache[pairing_id] = device_instance
+        # the device might have been unpaired while the instance was created
+        if self._is_paired(pairing_id):
+            self._instance_cache[pairing_id] = device_instance
         return device_instance
 
-    async def read_device_commands(self, pairing_id: str) -> List[DeviceCommand]:
-        """Reads the commands provided by the given paired device"""
+    async def read_device_commands(self, pairing_id: str) -> List[Tuple[DeviceCommand, str]]:
+        """Reads the commands provided by the given paired device, each together
+        with its icon encoded as base64. The list is cached per pairing ID."""
+        if pairing_id in self._commands_cache and self._is_paired(pairing_id):
+            return self._commands_cache[pairing_id]
+
         try:
             device_instance = await self.device_instance_for_pairing_id(pairing_id)
-            commands = await device_instance.get_commands()
+            commands = [
+                (c, base64.b64encode(c.icon).decode('ascii'))
+                for c in await device_instance.get_commands()
+            ]
+            # the device might have been unpaired while the commands were read
+            if self._is_paired(pairing_id):
+                self._commands_cache[pairing_id] = commands
             return commands
         except KeyError as ex:
-            raise DeviceNotFoundException(f"The device with the pairing ID '{pairing_id}' wasn't found.") from ex
+            raise DeviceNotFoundException(message=f"The device with the pairing ID '{pairing_id}' wasn't found.") from ex
 
     async def get_remote_layout(self, pairing_id: str) -> Tuple[int, int, List[List[int]]]:
         """"Reads the remote layout"""
+        if pairing_id in self._layout_cache and self._is_paired(pairing_id):
+            return self._layout_cache[pairing_id]
+
         try:
             device_instance = await self.device_instance_for_pairing_id(pairing_id)
             width, height = device_instance.remote_layout_size
             buttons = device_instance.remote_layout
+            # the device might have been unpaired while the instance was created
+            if self._is_paired(pairing_id):
+                self._layout_cache[pairing_id] = width, height, buttons
             return width, height, buttons
         except KeyError as ex:
-            raise DeviceNotFoundException(f"The device with the pairing ID '{pairing_id}' wasn't found.") from ex
+            raise DeviceNotFoundException(message=f"The device with the pairing ID '{pairing_id}' wasn't found.") from ex
 
     async def execute_device_command(self, pairing_id: str, command_id: int):
         """Execute the command with the given ID."""
@@ -191,11 +266,11 @@ class DriverManager(metaclass=SingletonMeta):
             device_command = await device_instance.get_command(command_id)
             await device_instance.execute(device_command)
         except KeyError as ex:
-            raise DeviceNotFoundException(f"The device with the pairing ID '{pairing_id}' wasn't found.") from ex
+            raise DeviceNotFoundException(message=f"The device with the pairing ID '{pairing_id}' wasn't found.") from ex
 
     async def is_device_ready(self, pairing_id: str) -> bool:
         try:
             device_instance = await self.device_instance_for_pairing_id(pairing_id)
             return await device_instance.is_device_ready
         except KeyError as ex:
-            raise DeviceNotFoundException(f"The device with the pairing ID '{pairing_id}' wasn't found.") from ex
+            raise DeviceNotFoundException(message=f"The device with the pairing ID '{pairing_id}' wasn't found.") from ex
@@ -17,26 +17,43 @@
 """
 
 import argparse
+import functools
+import ipaddress
 import os
 import socket
 import sys
+from contextlib import asynccontextmanager
+from typing import Optional, Tuple
 
 import uvicorn
-import zeroconf
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from pi_control_hub_api.apis.default_api import router as DefaultApiRouter
 from pi_control_hub_driver_api import DeviceDriverDescriptor
+from zeroconf.asyncio import AsyncServiceInfo, AsyncZeroconf
 
 from pi_control_hub import __version__
-from pi_control_hub.api_implementation import PiControlHubApi
+# Importing the implementation registers it with BaseDefaultApi, the router
+# dispatches every request to it.
+from pi_control_hub.api_implementation import PiControlHubApi  # pylint: disable=unused-import
 from pi_control_hub.database import Shelve
+from pi_control_hub.driver_manager import DriverManager
 
 
+@functools.lru_cache(maxsize=None)
 def get_ip_address() -> str:
-    """Returns the IP address of this machine."""
-    hostname = socket.gethostname()
-    return socket.gethostbyname(hostname)
-
+    """Returns the IP address of the interface this machine uses for outgoing
+    traffic. Connecting a UDP socket doesn't send any packet and doesn't need
+    a DNS lookup, it only lets the kernel pick the route."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        sock.connect(("8.8.8.8", 80))
+        return sock.getsockname()[0]
+    except OSError:
+        return "127.0.0.1"
+    finally:
+        sock.close()
 
 
 def create_argsparser() -> argparse.ArgumentParser:
@@ -48,8 +65,8 @@ def create_argsparser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--ip-address",
         action="store",
-        default=get_ip_address(),
-        help="The IP address from which the server is listining.",
+        default=None,
+        help="The IP address from which the server is listining. Defaults to the address of the interface with the default route.",
     )
     parser.add_argument(
         "--port",
@@ -69,6 +86,13 @@ def create_argsparser() -> argparse.ArgumentParser:
         default="pi-control-hub.store",
         help="The name of the database file with any path component. The database is created in the configuration directory.",
     )
+    parser.add_argument(
+        "--loop",
+        action="store",
+        default="auto",
+        choices=["auto", "asyncio", "uvloop"],
+        help="The event loop implementation used by the server.",
+    )
     parser.add_argument(
         "--instance-name",
         action="store",
@@ -90,39 +114,78 @@ def create_argsparser() -> argparse.ArgumentParser:
     return parser
 
 
-def create_app() -> FastAPI:
-    """Create the FastAPI app."""
+def create_app(instance_name: str = None, ip_address: str = None, port: int = None) -> FastAPI:
+    """Create the FastAPI app. If an instance name is given, the service is
+    advertised via Zeroconf while the app is running. The database is closed
+    when the app shuts down."""
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI):
+        aiozc, zc_info = None, None
+        if instance_name is not None:
+            aiozc, zc_info = await advertise_service(instance_name, ip_address, port)
+        yield
+        try:
+            if aiozc is not None:
+                await (await aiozc.async_unregister_service(zc_info))
+                await aiozc.async_close()
+        finally:
+            Shelve.close_instance()
+
     app = FastAPI(
         title="PiControl Hub",
         description="The PiControl Hub server",
         version=__version__,
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+    @app.get("/healthz")
+    async def healthz():
+        """Liveness probe that doesn't touch drivers or the database."""
+        return {"ok": True}
+
+    @app.get("/readyz")
+    async def readyz():
+        """Readiness probe, answers 503 until the drivers and the paired devices
+        are loaded, and again once the database is closed."""
+        if not DriverManager().is_ready:
+            return ORJSONResponse(status_code=503, content={"ready": False})
+        return {"ready": True}
+
     app.include_router(DefaultApiRouter)
     return app
 
 
-def advertise_service(instance_name: str, ip_address: str, port: int):
-    """Advertises this service via Zeroconf."""
-    if ip_address == "127.0.0.1" or ip_address == "0.0.0.0":
-        return None
+async def advertise_service(
+        instance_name: str,
+        ip_address: str,
+        port: int) -> Tuple[Optional[AsyncZeroconf], Optional[AsyncServiceInfo]]:
+    """Advertises this service via Zeroconf and waits until the service
+    has been registered and announced."""
+    address = ipaddress.ip_address(ip_address)
+    if address.is_loopback or address.is_unspecified:
+        return None, None
+    url_host = f"[{address}]" if address.version == 6 else str(address)
     zc_type = "_pi-ctrl-hub._tcp.local."
-    fq_hostname = socket.getfqdn()
     service_name = f"{instance_name}.{zc_type}"
-    zc_info = zeroconf.ServiceInfo(
+    server_name = f"{socket.gethostname().split('.')[0]}.local."
+    zc_info = AsyncServiceInfo(
         zc_type,
         service_name,
-        addresses=[socket.inet_aton(ip_address)],
+        addresses=[address.packed],
         port=port,
-        properties={"url": f"http://{fq_hostname}:{port}"},
-        server=fq_hostname,
+        properties={b"url": f"http://{url_host}:{port}".encode()},
+        server=server_name,
     )
-    zconf = zeroconf.Zeroconf()
-    zconf.register_service(zc_info)
-    return zconf
+    aiozc = AsyncZeroconf()
+    await (await aiozc.async_register_service(zc_info))
+    return aiozc, zc_info
 
 
-def validate_args(args: argparse.ArgumentParser):
-    """Validates the arguments."""
+def validate_args(args: argparse.Namespace):
+    """Validates the arguments. The expanded configuration path is stored back
+    into args.config_path and the database path into args.db_path."""
     cfg_path = os.path.expanduser(args.config_path)
     if cfg_path != os.path.abspath(cfg_path):
         raise ValueError("The value of the argument --config-path is not an absolute path.")
@@ -131,23 +194,28 @@ def validate_args(args: argparse.ArgumentParser):
     if db_path != os.path.abspath(db_path):
         raise ValueError("The value of the argument --db-filename contains relative path spcifiers.")
 
+    args.config_path = cfg_path
+    args.db_path = db_path
+
 
 def main():
     """Entry point of the server."""
     args_parser = create_argsparser()
     args, _ = args_parser.parse_known_args(sys.argv)
+    if args.ip_address is None:
+        args.ip_address = get_ip_address()
 
     validate_args(args)
 
-    DeviceDriverDescriptor.set_config_path(os.path.expanduser(args.config_path))
+    DeviceDriverDescriptor.set_config_path(args.config_path)
     DeviceDriverDescriptor.set_ir_gpio_in(args.ir_gpio_in)
     DeviceDriverDescriptor.set_ir_gpio_out(args.ir_gpio_out)
-    Shelve.set_database_path(os.path.join(os.path.expanduser(args.config_path), args.db_filename))
-
-    zconf = advertise_service(args.instance_name, args.ip_address, int(args.port))
+    Shelve.set_database_path(args.db_path)
 
-    app = create_app()
-    uvicorn.run(app, host=args.ip_address, port=int(args.port), loop="asyncio")
+    app = create_app(args.instance_name, args.ip_address, int(args.port))
+    DriverManager().preload()
+    app.openapi()
+    uvicorn.run(app, host=args.ip_address, port=int(args.port), loop=args.loop, http="httptools")
 
 if __name__ == "__main__":
     main()
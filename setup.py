@@ -27,10 +27,14 @@ setup(
     author_email=__author_email__,
     license='Apache 2.0',
     packages=['pi_control_hub'],
+    python_requires='>=3.11',
     install_requires=[
         'fastapi==0.109.2',
         'zeroconf>=0.131.0',
         'cachetools>=5.3.2',
+        'orjson>=3.9.0',
+        'uvloop>=0.19.0; sys_platform != "win32"',
+        'httptools>=0.6.1',
         'pi_control_hub_api @ git+https://github.com/PiControl/pi_control_hub_api.git@main#egg=pi_control_hub_api',
         'pi_control_hub_driver_api @ git+https://github.com/PiControl/pi_control_hub_driver_api.git@main#egg=pi_control_hub_driver_api',
     ],
@@ -45,5 +49,7 @@ setup(
         'License :: OSI Approved :: Apache Software License',
         'Operating System :: POSIX',
         'Programming Language :: Python :: 3',
+        'Programming Language :: Python :: 3.11',
+        'Programming Language :: Python :: 3.12',
     ],
 )